@@ -1,20 +1,62 @@
+import importlib.util
 import os
+import re
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
 
-from fastapi import APIRouter
-from starlette.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Query
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
+from hdf5_reader_service.cache import (
+    FileIdentity,
+    LRUCache,
+    add_invalidation_callback,
+    file_identity,
+    is_under,
+    normalize_path,
+)
+from hdf5_reader_service.catalog import Catalog, get_catalog
 from hdf5_reader_service.model import (
+    CatalogFiles,
+    CatalogNodes,
     DataTree,
+    FlatTree,
     MetadataNode,
     NodeChildren,
+    NodeKind,
+    SearchResults,
     ShapeMetadata,
+    SliceFormat,
+    TreeFormat,
+)
+from hdf5_reader_service.utils import (
+    ArrowIPCResponse,
+    NumpyBinaryResponse,
+    NumpySafeJSONResponse,
+    safe_json_dump,
 )
-from hdf5_reader_service.utils import NumpySafeJSONResponse
+from hdf5_reader_service.watch import NOTIFIER, WATCH_ROOTS, is_relevant
 
 from .fork import fork_and_do
-from .tasks import fetch_children, fetch_metadata, fetch_shapes, fetch_slice, fetch_tree
+from .tasks import (
+    fetch_children,
+    fetch_flat_tree,
+    fetch_metadata,
+    fetch_shapes,
+    fetch_slice,
+    fetch_tree,
+)
+from .tasks.search import search_index
+from .tasks.tree import flat_tree_to_arrow
 
 SWMR_DEFAULT = bool(int(os.getenv("HDF5_SWMR_DEFAULT", "1")))
+INDEX_CACHE_SIZE = int(os.getenv("HDF5_INDEX_CACHE_SIZE", "64"))
+
+#: Flat trees of whole files, used as search indexes
+_INDEX_CACHE: LRUCache[FileIdentity, dict[str, list[Any]]] = LRUCache(INDEX_CACHE_SIZE)
+add_invalidation_callback(
+    lambda path: _INDEX_CACHE.discard(lambda identity: is_under(identity.path, path))
+)
 
 router = APIRouter()
 
@@ -33,6 +75,111 @@ def get_children(path: str, subpath: str = "/") -> JSONResponse:
     return NumpySafeJSONResponse(nodes)
 
 
+@router.get("/find/", response_model=SearchResults)
+def find(
+    path: str,
+    subpath: str = "/",
+    pattern: str | None = None,
+    regex: str | None = None,
+    kind: NodeKind | None = None,
+    attribute: Annotated[list[str] | None, Query()] = None,
+) -> JSONResponse:
+    """Function that tells flask to search the HDF5 file recursively.
+    pattern is a glob on node names (or full paths if it contains "/"), regex
+    is searched for in full paths and each attribute takes the form NAME or
+    NAME=VALUE. The file is indexed on first use and the index is cached until
+    the file changes.
+    """
+    try:
+        compiled = re.compile(regex) if regex is not None else None
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid regex: {e}") from e
+
+    results = search_index(
+        _file_index(path), subpath, pattern, compiled, kind, attribute or ()
+    )
+    return NumpySafeJSONResponse(results)
+
+
+def _file_index(path: str) -> dict[str, list[Any]]:
+    identity = file_identity("/" + path)
+    index = _INDEX_CACHE.get(identity)
+    if index is None:
+        index = fork_and_do(fetch_flat_tree, args=(path, "/", SWMR_DEFAULT))
+        _INDEX_CACHE.put(identity, index)
+    return index
+
+
+@router.get("/catalog/files/", response_model=CatalogFiles)
+def get_catalog_files(pattern: str | None = None, limit: int = 1000) -> JSONResponse:
+    """Function that tells flask to list the files in the directory catalog.
+    pattern is a glob on file paths.
+    """
+    return NumpySafeJSONResponse(_require_catalog().files(pattern, limit))
+
+
+@router.get("/catalog/nodes/", response_model=CatalogNodes)
+def get_catalog_nodes(
+    pattern: str | None = None,
+    file_pattern: str | None = None,
+    kind: NodeKind | None = None,
+    dtype: str | None = None,
+    ndim: int | None = None,
+    attribute: Annotated[list[str] | None, Query()] = None,
+    limit: int = 1000,
+) -> JSONResponse:
+    """Function that tells flask to search nodes across the directory catalog.
+    pattern and attribute work as for /find/, file_pattern is a glob on file
+    paths.
+    """
+    nodes = _require_catalog().nodes(
+        pattern,
+        file_pattern,
+        kind.value if kind is not None else None,
+        dtype,
+        ndim,
+        attribute or (),
+        limit,
+    )
+    return NumpySafeJSONResponse(nodes)
+
+
+def _require_catalog() -> Catalog:
+    catalog = get_catalog()
+    if catalog is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No catalog configured, set HDF5_CATALOG_ROOTS to enable it",
+        )
+    return catalog
+
+
+@router.get("/changes/", response_class=StreamingResponse)
+async def get_changes(path: str | None = None) -> StreamingResponse:
+    """Function that tells flask to stream changes to files, as server-sent
+    events carrying FileChange JSON, optionally only for the file or directory
+    at path. Requires HDF5_WATCH_ROOTS to be set.
+    """
+    if not WATCH_ROOTS:
+        raise HTTPException(
+            status_code=404,
+            detail="No files watched, set HDF5_WATCH_ROOTS to enable notifications",
+        )
+    prefix = normalize_path("/" + path) if path is not None else None
+    queue = NOTIFIER.subscribe()
+
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            while True:
+                change = await queue.get()
+                if is_relevant(change, prefix):
+                    yield b"data: " + safe_json_dump(change) + b"\n\n"
+        finally:
+            NOTIFIER.unsubscribe(queue)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/shapes/", response_model=DataTree[ShapeMetadata])
 def get_shapes(path: str, subpath: str = "/") -> JSONResponse:
     """Function that tells flask to get the shapes of the HDF5 datasets."""
@@ -42,20 +189,51 @@ def get_shapes(path: str, subpath: str = "/") -> JSONResponse:
 
 @router.get("/slice/")
 def get_slice(
-    path: str, subpath: str = "/", slice_info: str | None = None
-) -> JSONResponse:
+    path: str,
+    subpath: str = "/",
+    slice_info: str | None = None,
+    format: SliceFormat = SliceFormat.JSON,
+) -> Response:
     """Function that tells flask to output the metadata of the HDF5 file node.
     The slice_info parameter should take the form
     start:stop:steps,start:stop:steps,...
+    The binary format sends the raw array, see NumpyBinaryResponse.
     """
     data_slice = fork_and_do(
         fetch_slice, args=(path, subpath, slice_info, SWMR_DEFAULT)
     )
+    if format is SliceFormat.BINARY:
+        if data_slice.dtype.hasobject:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{subpath} has variable-length items, use the json format",
+            )
+        return NumpyBinaryResponse(data_slice)
     return NumpySafeJSONResponse(data_slice)
 
 
-@router.get("/tree/", response_model=DataTree[MetadataNode])
-def get_tree(path: str, subpath: str = "/") -> JSONResponse:
-    """Function that tells flask to render the tree of the HDF5 file."""
-    tree = fork_and_do(fetch_tree, args=(path, subpath, SWMR_DEFAULT))
-    return NumpySafeJSONResponse(tree)
+@router.get("/tree/", response_model=DataTree[MetadataNode] | FlatTree)
+def get_tree(
+    path: str, subpath: str = "/", format: TreeFormat = TreeFormat.NESTED
+) -> Response:
+    """Function that tells flask to render the tree of the HDF5 file.
+    The columnar and arrow formats flatten the tree into parallel per-node
+    arrays, see FlatTree.
+    """
+    if format is TreeFormat.NESTED:
+        tree = fork_and_do(fetch_tree, args=(path, subpath, SWMR_DEFAULT))
+        return NumpySafeJSONResponse(tree)
+
+    if format is TreeFormat.ARROW:
+        _require_pyarrow()
+    flat = fork_and_do(fetch_flat_tree, args=(path, subpath, SWMR_DEFAULT))
+    if format is TreeFormat.ARROW:
+        return ArrowIPCResponse(flat_tree_to_arrow(flat))
+    return NumpySafeJSONResponse(flat)
+
+
+def _require_pyarrow() -> None:
+    if importlib.util.find_spec("pyarrow") is None:
+        raise HTTPException(
+            status_code=501, detail="Arrow output requires pyarrow to be installed"
+        )
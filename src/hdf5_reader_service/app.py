@@ -1,9 +1,28 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from .api import router
+from .cache import set_watched_roots
+from .catalog import start_indexer
+from .watch import start_watcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    indexer = start_indexer()
+    watcher = start_watcher()
+    yield
+    if watcher is not None:
+        set_watched_roots([])
+        watcher.stop()
+    if indexer is not None:
+        indexer.stop()
+
 
 # Setup the app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(router)
 
 
@@ -0,0 +1,164 @@
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+@dataclass(frozen=True)
+class FileIdentity:
+    """
+    A file as it is on disk right now: if the file is rewritten or modified, its
+    identity changes, so anything cached under the old identity is never served
+    again.
+    """
+
+    path: str
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+
+
+#: Roots under which a watcher reports every change, see :mod:`.watch`
+_watched_roots: tuple[str, ...] = ()
+#: Identities of watched files, trusted until the watcher reports a change
+_known_identities: dict[str, FileIdentity] = {}
+_invalidation_callbacks: list[Callable[[str], None]] = []
+_generation = 0
+_lock = threading.Lock()
+
+
+def file_identity(path: str) -> FileIdentity:
+    """
+    The identity of the file at path. Files under watched roots are only stat'd
+    the first time, until the watcher invalidates them.
+    """
+    path = normalize_path(path)
+    watched = is_watched(path)
+    if watched:
+        identity = _known_identities.get(path)
+        if identity is not None:
+            return identity
+        generation = _generation
+
+    stat = os.stat(path)
+    identity = FileIdentity(
+        path=path,
+        device=stat.st_dev,
+        inode=stat.st_ino,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+    )
+    if watched:
+        with _lock:
+            # Don't remember a stat that may predate an invalidation
+            if generation == _generation:
+                _known_identities[path] = identity
+    return identity
+
+
+def normalize_path(path: str) -> str:
+    path = os.path.normpath(path)
+    # normpath preserves a leading "//", which POSIX allows to mean something else
+    return "/" + path.lstrip("/") if path.startswith("//") else path
+
+
+def set_watched_roots(roots: list[str]) -> None:
+    global _watched_roots
+    with _lock:
+        _watched_roots = tuple(normalize_path(root) for root in roots)
+        _known_identities.clear()
+
+
+def is_watched(path: str) -> bool:
+    return any(is_under(path, root) for root in _watched_roots)
+
+
+def is_under(path: str, root: str) -> bool:
+    return path == root or path.startswith(root.rstrip("/") + "/")
+
+
+def add_invalidation_callback(callback: Callable[[str], None]) -> None:
+    """
+    Call callback with the path of every file or directory reported changed, so
+    that caches can drop whatever they hold for it (see :func:`is_under`).
+    """
+    _invalidation_callbacks.append(callback)
+
+
+def invalidate(path: str) -> None:
+    """Forget everything known about the file at path, or the files under it."""
+    global _generation
+    path = normalize_path(path)
+    with _lock:
+        _generation += 1
+        for known in [known for known in _known_identities if is_under(known, path)]:
+            del _known_identities[known]
+    for callback in _invalidation_callbacks:
+        callback(path)
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe least-recently-used cache, bounded by the total size of its values
+    as measured by sizeof (by default, each value has size 1, so the bound is on the
+    number of entries). Values larger than the whole budget are not cached.
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable[[V], int] = lambda _: 1):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = sizeof
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: K, value: V) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.max_size:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_size:
+                self._pop(next(iter(self._entries)))
+
+    def discard(self, predicate: Callable[[K], bool]) -> None:
+        """Remove every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
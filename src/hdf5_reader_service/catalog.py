@@ -0,0 +1,320 @@
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+
+from .fork import fork_and_do
+from .tasks.catalog import fetch_file_summaries
+from .tasks.search import _as_str
+
+LOGGER = logging.getLogger(__name__)
+
+CATALOG_ROOTS = [
+    root for root in os.getenv("HDF5_CATALOG_ROOTS", "").split(os.pathsep) if root
+]
+CATALOG_DB = os.getenv(
+    "HDF5_CATALOG_DB",
+    os.path.join(tempfile.gettempdir(), "hdf5-reader-service-catalog.sqlite"),
+)
+CATALOG_INTERVAL = float(os.getenv("HDF5_CATALOG_INTERVAL", "60"))
+CATALOG_EXTENSIONS = tuple(
+    os.getenv("HDF5_CATALOG_EXTENSIONS", ".h5,.hdf5,.hdf,.nxs,.nx5").split(",")
+)
+
+#: Files summarised per worker process
+_BATCH_SIZE = 32
+#: Array attributes longer than this are not recorded
+_MAX_ATTRIBUTE_ELEMENTS = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    root TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    shape TEXT,
+    ndim INTEGER,
+    dtype TEXT
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    node_id INTEGER NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_root ON files(root);
+CREATE INDEX IF NOT EXISTS nodes_file ON nodes(file_id);
+CREATE INDEX IF NOT EXISTS nodes_name ON nodes(name);
+CREATE INDEX IF NOT EXISTS nodes_path ON nodes(path);
+CREATE INDEX IF NOT EXISTS attributes_node ON attributes(node_id);
+CREATE INDEX IF NOT EXISTS attributes_name_value ON attributes(name, value);
+"""
+
+
+class Catalog:
+    """
+    SQLite index of the structure of every HDF5 file under some directory roots,
+    so that questions spanning many files can be answered without opening any.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            connection.execute("PRAGMA foreign_keys=ON")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def scan(self, root: str, swmr: bool = True) -> int:
+        """
+        Bring the catalog up to date with root: index new files and files whose
+        size or mtime changed, and forget files that are gone.
+        Returns the number of files (re)indexed.
+        """
+        root = os.path.normpath(root)
+        with self._connect() as connection:
+            known = {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in connection.execute(
+                    "SELECT path, size, mtime_ns FROM files WHERE root = ?", (root,)
+                )
+            }
+
+        on_disk = dict(_find_files(root))
+        changed = [path for path, stat in on_disk.items() if known.get(path) != stat]
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM files WHERE path = ?",
+                [(path,) for path in known.keys() - on_disk.keys()],
+            )
+
+        for start in range(0, len(changed), _BATCH_SIZE):
+            batch = changed[start : start + _BATCH_SIZE]
+            summaries = fork_and_do(fetch_file_summaries, args=(batch, swmr))
+            with self._connect() as connection:
+                for summary in summaries:
+                    size, mtime_ns = on_disk[summary["path"]]
+                    _store(connection, root, size, mtime_ns, summary)
+        return len(changed)
+
+    def files(self, pattern: str | None = None, limit: int = 1000) -> dict[str, Any]:
+        """Files in the catalog, in the layout of :class:`CatalogFiles`."""
+        query = "SELECT path, size, mtime_ns, error FROM files"
+        parameters: list[Any] = []
+        if pattern is not None:
+            query += " WHERE path GLOB ?"
+            parameters.append(pattern)
+        query += " ORDER BY path LIMIT ?"
+        parameters.append(limit)
+        with self._connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+        return {
+            "files": [
+                {"path": path, "size": size, "mtime_ns": mtime_ns, "error": error}
+                for path, size, mtime_ns, error in rows
+            ]
+        }
+
+    def nodes(
+        self,
+        pattern: str | None = None,
+        file_pattern: str | None = None,
+        kind: str | None = None,
+        dtype: str | None = None,
+        ndim: int | None = None,
+        attributes: Iterable[str] = (),
+        limit: int = 1000,
+    ) -> dict[str, Any]:
+        """
+        Nodes across all files in the catalog, in the layout of
+        :class:`CatalogNodes`. pattern and attributes follow the conventions of
+        /find/, file_pattern is a glob on file paths.
+        """
+        conditions = []
+        parameters: list[Any] = []
+        if pattern is not None:
+            conditions.append("nodes.path GLOB ?" if "/" in pattern else "name GLOB ?")
+            parameters.append(pattern)
+        if file_pattern is not None:
+            conditions.append("files.path GLOB ?")
+            parameters.append(file_pattern)
+        for column, value in (("kind", kind), ("dtype", dtype), ("ndim", ndim)):
+            if value is not None:
+                conditions.append(f"nodes.{column} = ?")
+                parameters.append(value)
+        for attribute in attributes:
+            name, has_value, value = attribute.partition("=")
+            condition = "attributes.node_id = nodes.id AND attributes.name = ?"
+            parameters.append(name)
+            if has_value:
+                condition += " AND attributes.value = ?"
+                parameters.append(value)
+            conditions.append(f"EXISTS (SELECT 1 FROM attributes WHERE {condition})")
+
+        query = (
+            "SELECT files.path, nodes.path, kind, shape, dtype "
+            "FROM nodes JOIN files ON files.id = nodes.file_id"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY files.path, nodes.id LIMIT ?"
+        parameters.append(limit)
+        with self._connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+        return {
+            "nodes": [
+                {
+                    "file": file,
+                    "path": path,
+                    "kind": kind,
+                    "shape": json.loads(shape) if shape is not None else None,
+                    "dtype": dtype,
+                }
+                for file, path, kind, shape, dtype in rows
+            ]
+        }
+
+
+class CatalogIndexer:
+    """
+    Background thread rescanning the catalog roots every interval seconds.
+    """
+
+    def __init__(self, catalog: Catalog, roots: list[str], interval: float):
+        self.catalog = catalog
+        self.roots = roots
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="catalog-indexer", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for root in self.roots:
+                try:
+                    indexed = self.catalog.scan(root)
+                    LOGGER.info("Indexed %d files under %s", indexed, root)
+                except Exception:
+                    LOGGER.exception("Failed to index %s", root)
+                if self._stop.is_set():
+                    return
+            self._stop.wait(self.interval)
+
+
+_CATALOG: Catalog | None = None
+
+
+def get_catalog() -> Catalog | None:
+    """The catalog of the configured roots, or None if there are none."""
+    global _CATALOG
+    if _CATALOG is None and CATALOG_ROOTS:
+        _CATALOG = Catalog(CATALOG_DB)
+    return _CATALOG
+
+
+def start_indexer() -> CatalogIndexer | None:
+    catalog = get_catalog()
+    if catalog is None:
+        return None
+    indexer = CatalogIndexer(catalog, CATALOG_ROOTS, CATALOG_INTERVAL)
+    indexer.start()
+    return indexer
+
+
+def _find_files(root: str) -> Iterator[tuple[str, tuple[int, int]]]:
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.endswith(CATALOG_EXTENSIONS) and not name.startswith("."):
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, (stat.st_size, stat.st_mtime_ns)
+
+
+def _store(
+    connection: sqlite3.Connection,
+    root: str,
+    size: int,
+    mtime_ns: int,
+    summary: dict[str, Any],
+) -> None:
+    connection.execute("DELETE FROM files WHERE path = ?", (summary["path"],))
+    file_id = connection.execute(
+        "INSERT INTO files (path, root, size, mtime_ns, error) VALUES (?, ?, ?, ?, ?)",
+        (summary["path"], root, size, mtime_ns, summary.get("error")),
+    ).lastrowid
+    tree = summary.get("tree")
+    if tree is None:
+        return
+
+    offsets = tree["attribute_offsets"]
+    for i, path in enumerate(tree["paths"]):
+        shape = tree["shapes"][i]
+        node_id = connection.execute(
+            "INSERT INTO nodes (file_id, path, name, kind, shape, ndim, dtype) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                file_id,
+                path,
+                path.rsplit("/", 1)[-1],
+                tree["kinds"][i].value,
+                json.dumps(list(shape)) if shape is not None else None,
+                len(shape) if shape is not None else None,
+                tree["dtypes"][i],
+            ),
+        ).lastrowid
+        connection.executemany(
+            "INSERT INTO attributes (node_id, name, value) VALUES (?, ?, ?)",
+            [
+                (node_id, name, value)
+                for name, values in zip(
+                    tree["attribute_names"][offsets[i] : offsets[i + 1]],
+                    tree["attribute_values"][offsets[i] : offsets[i + 1]],
+                    strict=True,
+                )
+                for value in _attribute_texts(values)
+            ],
+        )
+
+
+def _attribute_texts(value: Any) -> list[str]:
+    """One text per element, so that array attributes such as NeXus axes can be
+    matched element by element, as in /find/."""
+    if isinstance(value, np.ndarray):
+        if value.size > _MAX_ATTRIBUTE_ELEMENTS:
+            return []
+        return [_as_str(v) for v in value.flat]
+    return [_as_str(value)]
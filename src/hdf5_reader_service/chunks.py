@@ -0,0 +1,183 @@
+import itertools
+import os
+import struct
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import numpy as np
+
+DECOMPRESSION_THREADS = int(
+    os.getenv("HDF5_DECOMPRESSION_THREADS", str(len(os.sched_getaffinity(0))))
+)
+#: Below this many chunks, reading through HDF5 is as fast
+MIN_PARALLEL_CHUNKS = int(os.getenv("HDF5_MIN_PARALLEL_CHUNKS", "4"))
+
+FILTER_DEFLATE = 1
+FILTER_SHUFFLE = 2
+FILTER_LZ4 = 32004
+
+#: A per-axis selection, as (start, stop, step) with a positive step, already
+#: clipped to the extent of the axis as by slice.indices
+AxisRange = tuple[int, int, int]
+
+
+def read_in_parallel(dataset: h5py.Dataset, ranges: tuple[AxisRange, ...]) -> bool:
+    """
+    Whether the selection is worth reading with :func:`read_chunks`, and whether
+    read_chunks can decode the dataset's chunks itself.
+    """
+    if DECOMPRESSION_THREADS < 2 or dataset.chunks is None or dataset.is_virtual:
+        return False
+    if dataset.dtype.hasobject or h5py.check_vlen_dtype(dataset.dtype) is not None:
+        return False
+    codes = _filter_codes(dataset)
+    if not codes or not all(code in _DECODERS for code in codes):
+        return False
+    n_chunks = 1
+    for (start, stop, step), chunk in zip(ranges, dataset.chunks, strict=True):
+        n_chunks *= len(_axis_chunks(start, stop, step, chunk))
+    return n_chunks >= MIN_PARALLEL_CHUNKS
+
+
+def read_chunks(dataset: h5py.Dataset, ranges: tuple[AxisRange, ...]) -> np.ndarray:
+    """
+    Read a selection by fetching the raw chunks that intersect it and decoding
+    them on a thread pool. zlib and lz4 release the GIL, so decompression runs on
+    as many cores as there are threads, while HDF5 itself only reads bytes.
+    Chunks that were never written read as the fill value.
+    """
+    assert dataset.chunks is not None
+    shape = tuple(len(range(*r)) for r in ranges)
+    out = np.empty(shape, dtype=dataset.dtype)
+    if out.size == 0:
+        return out
+    pipeline = _decode_pipeline(dataset)
+    chunk_shape = dataset.chunks
+    per_axis = [
+        _axis_chunks(start, stop, step, chunk)
+        for (start, stop, step), chunk in zip(ranges, chunk_shape, strict=True)
+    ]
+
+    def copy_chunk(parts: tuple[tuple[int, slice, slice], ...]) -> None:
+        offset = tuple(part[0] for part in parts)
+        in_chunk = tuple(part[1] for part in parts)
+        in_out = tuple(part[2] for part in parts)
+        if dataset.id.get_chunk_info_by_coord(offset).byte_offset is None:
+            out[in_out] = dataset.fillvalue
+            return
+        filter_mask, raw = dataset.id.read_direct_chunk(offset)
+        for i, decode in reversed(pipeline):
+            if not filter_mask & (1 << i):
+                raw = decode(raw)
+        chunk = np.frombuffer(raw, dtype=dataset.dtype).reshape(chunk_shape)
+        out[in_out] = chunk[in_chunk]
+
+    with ThreadPoolExecutor(DECOMPRESSION_THREADS) as pool:
+        # list() to surface any exception from the workers
+        list(pool.map(copy_chunk, itertools.product(*per_axis)))
+    return out
+
+
+def _axis_chunks(
+    start: int, stop: int, step: int, chunk: int
+) -> list[tuple[int, slice, slice]]:
+    """
+    The chunks along one axis holding selected elements, as (chunk offset,
+    selection within the chunk, destination in the output) for each.
+    """
+    count = len(range(start, stop, step))
+    if count == 0:
+        return []
+    last = start + (count - 1) * step
+    parts = []
+    for origin in range(start // chunk * chunk, last + 1, chunk):
+        first = start + -(-max(origin - start, 0) // step) * step
+        end = min(last + 1, origin + chunk)
+        if first >= end:
+            # Stepped right over this chunk
+            continue
+        n = len(range(first, end, step))
+        out_start = (first - start) // step
+        parts.append(
+            (
+                origin,
+                slice(first - origin, end - origin, step),
+                slice(out_start, out_start + n),
+            )
+        )
+    return parts
+
+
+def _filter_codes(dataset: h5py.Dataset) -> list[int]:
+    plist = dataset.id.get_create_plist()
+    return [plist.get_filter(i)[0] for i in range(plist.get_nfilters())]
+
+
+def _decode_pipeline(
+    dataset: h5py.Dataset,
+) -> list[tuple[int, Callable[[bytes], bytes]]]:
+    """The decoder for each filter, with its position in the filter pipeline."""
+    plist = dataset.id.get_create_plist()
+    pipeline = []
+    for i in range(plist.get_nfilters()):
+        code, _, values, _ = plist.get_filter(i)
+        pipeline.append((i, _DECODERS[code](dataset, values)))
+    return pipeline
+
+
+def _deflate(dataset: h5py.Dataset, values: tuple[int, ...]):
+    return zlib.decompress
+
+
+def _shuffle(dataset: h5py.Dataset, values: tuple[int, ...]):
+    itemsize = dataset.dtype.itemsize
+
+    def unshuffle(raw: bytes) -> bytes:
+        buffer = np.frombuffer(raw, dtype=np.uint8)
+        n = len(buffer) // itemsize
+        # Shuffle leaves any bytes that don't make up a whole element in place
+        shuffled, rest = buffer[: n * itemsize], buffer[n * itemsize :]
+        return shuffled.reshape(itemsize, n).T.tobytes() + rest.tobytes()
+
+    return unshuffle
+
+
+def _lz4(dataset: h5py.Dataset, values: tuple[int, ...]):
+    import lz4.block
+
+    def decompress(raw: bytes) -> bytes:
+        # HDF5 LZ4 filter framing: total size and block size, then blocks each
+        # prefixed with their compressed size (equal to the block size if stored
+        # uncompressed), all big-endian
+        total, block_size = struct.unpack_from(">QI", raw)
+        offset = 12
+        blocks = []
+        remaining = total
+        while remaining > 0:
+            size = min(block_size, remaining)
+            (compressed,) = struct.unpack_from(">I", raw, offset)
+            offset += 4
+            block = raw[offset : offset + compressed]
+            offset += compressed
+            if compressed == size:
+                blocks.append(block)
+            else:
+                blocks.append(lz4.block.decompress(block, uncompressed_size=size))
+            remaining -= size
+        return b"".join(blocks)
+
+    return decompress
+
+
+_DECODERS: dict[int, Callable] = {
+    FILTER_DEFLATE: _deflate,
+    FILTER_SHUFFLE: _shuffle,
+}
+try:
+    import lz4.block  # noqa: F401
+
+    _DECODERS[FILTER_LZ4] = _lz4
+except ImportError:
+    pass
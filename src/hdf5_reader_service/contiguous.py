@@ -0,0 +1,37 @@
+import h5py
+import numpy as np
+
+
+def map_dataset(dataset: h5py.Dataset) -> np.memmap | None:
+    """
+    Memory-map a dataset stored as one contiguous, unfiltered block of the file,
+    so that slices of it are views of the page cache rather than copies made by
+    HDF5. Returns None for any other storage, which must be read through h5py.
+    """
+    if dataset.file.driver != "sec2" or dataset.shape is None or dataset.size == 0:
+        return None
+    if dataset.ndim == 0 or dataset.is_virtual:
+        return None
+    if dataset.dtype.hasobject or h5py.check_vlen_dtype(dataset.dtype) is not None:
+        return None
+    plist = dataset.id.get_create_plist()
+    if (
+        plist.get_layout() != h5py.h5d.CONTIGUOUS
+        or plist.get_nfilters() > 0
+        or plist.get_external_count() > 0
+    ):
+        return None
+    # Space for the data is allocated on first write, until then it reads as
+    # the fill value and the offset is meaningless
+    if dataset.id.get_storage_size() < dataset.size * dataset.dtype.itemsize:
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+    return np.memmap(
+        dataset.file.filename,
+        dtype=dataset.dtype,
+        mode="r",
+        offset=offset,
+        shape=dataset.shape,
+    )
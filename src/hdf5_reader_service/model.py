@@ -48,6 +48,90 @@ class NodeChildren(BaseModel):
     nodes: list[str]
 
 
+class NodeKind(Enum):
+    GROUP = "GROUP"
+    DATASET = "DATASET"
+    MISSING_LINK = "MISSING_LINK"
+
+
+class FlatTree(BaseModel):
+    """
+    Columnar form of a tree: entry i of each per-node list describes the same node.
+
+    Nodes are listed parents-first, parents[i] is the index of the parent of node i
+    (-1 for the root). The attributes of node i are attribute_names[j] and
+    attribute_values[j] for attribute_offsets[i] <= j < attribute_offsets[i + 1].
+    """
+
+    paths: list[str]
+    parents: list[int]
+    kinds: list[NodeKind]
+    shapes: list[tuple[int, ...] | None]
+    dtypes: list[str | None]
+    chunks: list[tuple[int, ...] | None]
+    attribute_offsets: list[int]
+    attribute_names: list[str]
+    attribute_values: list[Any]
+
+
+class SearchMatch(BaseModel):
+    path: str
+    kind: NodeKind
+    shape: tuple[int, ...] | None = None
+    dtype: str | None = None
+    attributes: Mapping[str, Any] = {}
+
+
+class SearchResults(BaseModel):
+    matches: list[SearchMatch]
+
+
+class CatalogFile(BaseModel):
+    path: str
+    size: int
+    mtime_ns: int
+    error: str | None = None
+
+
+class CatalogFiles(BaseModel):
+    files: list[CatalogFile]
+
+
+class CatalogNode(BaseModel):
+    file: str
+    path: str
+    kind: NodeKind
+    shape: tuple[int, ...] | None = None
+    dtype: str | None = None
+
+
+class CatalogNodes(BaseModel):
+    nodes: list[CatalogNode]
+
+
+class FileChangeKind(Enum):
+    CREATED = "CREATED"
+    MODIFIED = "MODIFIED"
+    CLOSED = "CLOSED"
+    DELETED = "DELETED"
+
+
+class FileChange(BaseModel):
+    path: str
+    kind: FileChangeKind
+
+
+class SliceFormat(Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+class TreeFormat(Enum):
+    NESTED = "nested"
+    COLUMNAR = "columnar"
+    ARROW = "arrow"
+
+
 class ShapeMetadata(BaseModel):
     shape: tuple[int, ...] | None = None
 
@@ -1,8 +1,9 @@
+from .catalog import fetch_file_summaries
 from .metadata import fetch_metadata
 from .search import fetch_children
 from .shapes import fetch_shapes
 from .slice import fetch_slice
-from .tree import fetch_tree
+from .tree import fetch_flat_tree, fetch_tree
 
 __all__ = [
     "fetch_metadata",
@@ -10,4 +11,6 @@ __all__ = [
     "fetch_shapes",
     "fetch_slice",
     "fetch_tree",
+    "fetch_flat_tree",
+    "fetch_file_summaries",
 ]
@@ -0,0 +1,21 @@
+from typing import Any
+
+import h5py
+
+from .tree import flat_tree
+
+
+def fetch_file_summaries(paths: list[str], swmr: bool) -> list[dict[str, Any]]:
+    """
+    Flat trees of several whole files, opened one after the other in the same
+    worker. A file that cannot be read is reported with its error rather than
+    failing the batch.
+    """
+    summaries = []
+    for path in paths:
+        try:
+            with h5py.File(path, "r", swmr=swmr, libver="latest") as f:
+                summaries.append({"path": path, "tree": flat_tree(f["/"])})
+        except Exception as e:
+            summaries.append({"path": path, "error": f"{type(e).__name__}: {e}"})
+    return summaries
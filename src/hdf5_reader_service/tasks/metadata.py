@@ -4,16 +4,10 @@ from typing import Any
 import h5py
 import numpy as np
 
-from hdf5_reader_service.model import (
-    ByteOrder,
-    DatasetMacroStructure,
-    DatasetMicroStructure,
-    DatasetStructure,
-    MetadataNode,
-)
+from hdf5_reader_service.model import ByteOrder
 
 
-def fetch_metadata(path: str, subpath: str, swmr: bool) -> MetadataNode:
+def fetch_metadata(path: str, subpath: str, swmr: bool) -> dict[str, Any]:
     path = "/" + path
 
     with h5py.File(path, "r", swmr=swmr, libver="latest") as f:
@@ -24,11 +18,14 @@ def fetch_metadata(path: str, subpath: str, swmr: bool) -> MetadataNode:
         return meta
 
 
-def metadata(node: h5py.HLObject) -> MetadataNode:
+def metadata(node: h5py.HLObject) -> dict[str, Any]:
+    """
+    Describe node as a plain dict in the layout of :class:`MetadataNode`.
+    """
     name = node.name or "node"
     attributes = _without_bytes(dict(node.attrs))
 
-    data = MetadataNode(name=name, attributes=attributes)
+    data: dict[str, Any] = {"name": name, "attributes": attributes, "structure": None}
 
     if isinstance(node, h5py.Dataset):
         shape = node.shape
@@ -37,13 +34,10 @@ def metadata(node: h5py.HLObject) -> MetadataNode:
         kind = node.dtype.kind
         byte_order = ByteOrder.of_hdf5_dataset(node)
 
-        structure = DatasetStructure(
-            macro=DatasetMacroStructure(chunks=chunks, shape=shape),
-            micro=DatasetMicroStructure(
-                itemsize=itemsize, kind=kind, byte_order=byte_order
-            ),
-        )
-        data.structure = structure
+        data["structure"] = {
+            "macro": {"shape": shape, "chunks": chunks},
+            "micro": {"itemsize": itemsize, "kind": kind, "byte_order": byte_order},
+        }
 
     return data
 
@@ -1,14 +1,98 @@
+import fnmatch
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
 import h5py
+import numpy as np
 
-from hdf5_reader_service.model import NodeChildren
+from hdf5_reader_service.model import NodeKind
 
 
-def fetch_children(path: str, subpath: str, swmr: bool) -> NodeChildren:
+def fetch_children(path: str, subpath: str, swmr: bool) -> dict[str, Any]:
     path = "/" + path
 
     with h5py.File(path, "r", swmr=swmr, libver="latest") as f:
         node = f[subpath]
         if isinstance(node, h5py.Group):
-            return NodeChildren(nodes=list(node.keys()))
+            return {"nodes": list(node.keys())}
         else:
             raise KeyError(f"{path}/{subpath} is not a group")
+
+
+def search_index(
+    index: Mapping[str, list[Any]],
+    subpath: str = "/",
+    pattern: str | None = None,
+    regex: re.Pattern[str] | None = None,
+    kind: NodeKind | None = None,
+    attributes: Iterable[str] = (),
+) -> dict[str, Any]:
+    """
+    Find nodes in a file index, the flat tree of the whole file, in the layout of
+    :class:`SearchResults`.
+
+    Every given criterion must match. A glob pattern containing "/" is matched
+    against the full path of each node, otherwise against its name alone, so
+    "data" finds every node called data. A regex is searched for in the full path.
+    Attribute predicates take the form "NAME", for any node with that attribute, or
+    "NAME=VALUE", for nodes whose attribute (or any element of an array attribute)
+    equals VALUE.
+    """
+    prefix = subpath.rstrip("/") + "/"
+    predicates = [_attribute_predicate(a) for a in attributes]
+    offsets = index["attribute_offsets"]
+
+    matches = []
+    for i, node_path in enumerate(index["paths"]):
+        if not (node_path + "/").startswith(prefix):
+            continue
+        if kind is not None and index["kinds"][i] is not kind:
+            continue
+        if pattern is not None:
+            target = node_path if "/" in pattern else node_path.rsplit("/", 1)[-1]
+            if not fnmatch.fnmatchcase(target, pattern):
+                continue
+        if regex is not None and regex.search(node_path) is None:
+            continue
+        node_attributes = dict(
+            zip(
+                index["attribute_names"][offsets[i] : offsets[i + 1]],
+                index["attribute_values"][offsets[i] : offsets[i + 1]],
+                strict=True,
+            )
+        )
+        if not all(predicate(node_attributes) for predicate in predicates):
+            continue
+        matches.append(
+            {
+                "path": node_path,
+                "kind": index["kinds"][i],
+                "shape": index["shapes"][i],
+                "dtype": index["dtypes"][i],
+                "attributes": node_attributes,
+            }
+        )
+    return {"matches": matches}
+
+
+def _attribute_predicate(expression: str):
+    name, has_value, expected = expression.partition("=")
+
+    def predicate(node_attributes: Mapping[str, Any]) -> bool:
+        if name not in node_attributes:
+            return False
+        if not has_value:
+            return True
+        value = node_attributes[name]
+        if isinstance(value, np.ndarray):
+            return any(_as_str(v) == expected for v in value.flat)
+        return _as_str(value) == expected
+
+    return predicate
+
+
+def _as_str(value: Any) -> str:
+    if isinstance(value, bytes | np.bytes_):
+        return value.decode("utf-8")
+    return str(value)
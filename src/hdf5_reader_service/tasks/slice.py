@@ -1,6 +1,9 @@
 import h5py
 import numpy as np
 
+from hdf5_reader_service.chunks import read_chunks, read_in_parallel
+from hdf5_reader_service.contiguous import map_dataset
+
 
 def fetch_slice(
     path: str, subpath: str, slice_info: str | None, swmr: bool
@@ -17,7 +20,7 @@ def fetch_slice(
                 dataset = f[subpath]
                 if isinstance(dataset, h5py.Dataset):
                     print(f"{subpath} IS a dataset!!!")
-                    return dataset[slices]
+                    return read_slice(dataset, slices)
                 else:
                     raise KeyError(
                         f"Expected {subpath} to be a dataset, \
@@ -26,3 +29,23 @@ def fetch_slice(
             else:
                 raise KeyError(f"{path} does not contain {subpath}")
     raise KeyError("Slice info not provided")
+
+
+def read_slice(dataset: h5py.Dataset, slices: tuple[slice, ...]) -> np.ndarray:
+    """
+    Read dataset[slices], straight from a memory map of the file for contiguous
+    datasets, decompressing chunks in parallel where that helps.
+    """
+    mapped = map_dataset(dataset)
+    if mapped is not None:
+        return np.ascontiguousarray(mapped[slices])
+    if len(slices) <= dataset.ndim and all(
+        s.step is None or s.step > 0 for s in slices
+    ):
+        padding = (slice(None),) * (dataset.ndim - len(slices))
+        ranges = tuple(
+            s.indices(n) for s, n in zip(slices + padding, dataset.shape, strict=True)
+        )
+        if read_in_parallel(dataset, ranges):
+            return read_chunks(dataset, ranges)
+    return dataset[slices]
@@ -1,16 +1,105 @@
+from typing import Any
+
 import h5py
 
-from hdf5_reader_service.model import DataTree, MetadataNode
-from hdf5_reader_service.utils import h5_tree_map
+from hdf5_reader_service.model import NodeKind
+from hdf5_reader_service.utils import h5_tree_map, safe_json_dump
 
-from .metadata import metadata
+from .metadata import _without_bytes, metadata
 
 
-def fetch_tree(path: str, subpath: str, swmr: bool) -> DataTree[MetadataNode]:
+def fetch_tree(path: str, subpath: str, swmr: bool) -> dict[str, Any]:
     path = "/" + path
 
-    def get_metadata(name: str, obj: h5py.HLObject) -> MetadataNode:
+    def get_metadata(name: str, obj: h5py.HLObject) -> dict[str, Any]:
         return metadata(obj)
 
     with h5py.File(path, "r", swmr=swmr, libver="latest") as f:
         return h5_tree_map(get_metadata, f[subpath])
+
+
+def fetch_flat_tree(path: str, subpath: str, swmr: bool) -> dict[str, list[Any]]:
+    path = "/" + path
+
+    with h5py.File(path, "r", swmr=swmr, libver="latest") as f:
+        return flat_tree(f[subpath])
+
+
+def flat_tree(root: h5py.HLObject) -> dict[str, list[Any]]:
+    """
+    Walk the hierarchy under root in one pass, in the columnar layout of
+    :class:`FlatTree`.
+    """
+    columns: dict[str, list[Any]] = {
+        "paths": [],
+        "parents": [],
+        "kinds": [],
+        "shapes": [],
+        "dtypes": [],
+        "chunks": [],
+        "attribute_offsets": [0],
+        "attribute_names": [],
+        "attribute_values": [],
+    }
+
+    def add(node_path: str, parent: int, node: h5py.HLObject | None) -> int:
+        columns["paths"].append(node_path)
+        columns["parents"].append(parent)
+        if isinstance(node, h5py.Dataset):
+            columns["kinds"].append(NodeKind.DATASET)
+            columns["shapes"].append(node.shape)
+            columns["dtypes"].append(node.dtype.str)
+            columns["chunks"].append(node.chunks)
+        else:
+            columns["kinds"].append(
+                NodeKind.GROUP if node is not None else NodeKind.MISSING_LINK
+            )
+            columns["shapes"].append(None)
+            columns["dtypes"].append(None)
+            columns["chunks"].append(None)
+        if node is not None:
+            attributes = _without_bytes(dict(node.attrs))
+            columns["attribute_names"].extend(attributes.keys())
+            columns["attribute_values"].extend(attributes.values())
+        columns["attribute_offsets"].append(len(columns["attribute_names"]))
+        return len(columns["paths"]) - 1
+
+    # Depth-first with an explicit stack so deep files cannot hit the
+    # recursion limit; parents are always added before their children.
+    stack: list[tuple[str, int, h5py.HLObject | None]] = [(root.name or "/", -1, root)]
+    while stack:
+        node_path, parent, node = stack.pop()
+        index = add(node_path, parent, node)
+        if isinstance(node, h5py.Group):
+            prefix = node_path.rstrip("/")
+            children = [(f"{prefix}/{k}", index, v) for k, v in node.items()]
+            stack.extend(reversed(children))
+    return columns
+
+
+def flat_tree_to_arrow(columns: dict[str, list[Any]]) -> Any:
+    """
+    Convert the output of :func:`flat_tree` to a ``pyarrow.Table`` with one row per
+    node. Attributes become list columns sharing the flat tree's offsets, with
+    values encoded as JSON strings since their types vary from node to node.
+    """
+    import pyarrow as pa
+
+    offsets = pa.array(columns["attribute_offsets"], pa.int32())
+    names = pa.array(columns["attribute_names"], pa.string())
+    values = pa.array(
+        [safe_json_dump(v).decode() for v in columns["attribute_values"]],
+        pa.string(),
+    )
+    return pa.table(
+        {
+            "path": pa.array(columns["paths"], pa.string()),
+            "parent": pa.array(columns["parents"], pa.int64()),
+            "kind": pa.array([k.value for k in columns["kinds"]], pa.string()),
+            "shape": pa.array(columns["shapes"], pa.list_(pa.int64())),
+            "dtype": pa.array(columns["dtypes"], pa.string()),
+            "chunks": pa.array(columns["chunks"], pa.list_(pa.int64())),
+            "attribute_names": pa.ListArray.from_arrays(offsets, names),
+            "attribute_values": pa.ListArray.from_arrays(offsets, values),
+        }
+    )
@@ -4,14 +4,9 @@ from typing import Any, TypeVar
 
 import h5py as h5
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from hdf5_reader_service.model import (
-    DataTree,
-    InvalidNode,
-    InvalidNodeReason,
-    ValidNode,
-)
+from hdf5_reader_service.model import InvalidNodeReason
 
 
 def safe_json_dump(content):
@@ -50,6 +45,59 @@ class NumpySafeJSONResponse(JSONResponse):
         return safe_json_dump(content)
 
 
+class ArrowIPCResponse(Response):
+    """
+    Render a ``pyarrow.Table`` as an Arrow IPC stream.
+    """
+
+    media_type = "application/vnd.apache.arrow.stream"
+
+    def render(self, content: Any) -> bytes:
+        import pyarrow as pa
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, content.schema) as writer:
+            writer.write_table(content)
+        return sink.getvalue().to_pybytes()
+
+
+class NumpyBinaryResponse(Response):
+    """
+    Send an array as its raw bytes in C order, described by X-Array-Dtype (the
+    numpy type string, or for structured types the JSON of their descr) and
+    X-Array-Shape (comma-separated) headers.
+    """
+
+    media_type = "application/octet-stream"
+
+    def __init__(
+        self, content: Any, headers: Mapping[str, str] | None = None, **kwargs
+    ):
+        import numpy as np
+
+        content = np.ascontiguousarray(content)
+        headers = {**(headers or {}), **array_headers(content)}
+        super().__init__(content, headers=headers, **kwargs)
+
+    def render(self, content: Any) -> memoryview:
+        # The array's own buffer, no copy
+        return content.data.cast("B")
+
+
+def array_headers(array: Any) -> dict[str, str]:
+    import numpy as np
+
+    dtype = array.dtype
+    if dtype.fields is None:
+        dtype_header = dtype.str
+    else:
+        dtype_header = safe_json_dump(np.lib.format.dtype_to_descr(dtype)).decode()
+    return {
+        "X-Array-Dtype": dtype_header,
+        "X-Array-Shape": ",".join(str(n) for n in array.shape),
+    }
+
+
 #: Something that can be passed to json.dump
 _Jsonable = Mapping[str, Any] | list[Any] | bool | int | float | str
 
@@ -59,24 +107,32 @@ T = TypeVar("T")
 
 def h5_tree_map(
     callback: Callable[[str, h5.HLObject], T], root: h5.HLObject
-) -> DataTree[T]:
+) -> dict[str, Any]:
+    """
+    Walk the HDF5 hierarchy under root, calling callback on every node.
+
+    The tree is built from plain dicts in the layout of :class:`DataTree`, rather
+    than the pydantic models themselves, so that it is cheap to build, to pickle
+    back from a worker process and to serialize with orjson. The models remain the
+    schema of the result.
+    """
     name = root.name.split("/")[-1] if root.name else "root"
-    block: DataTree[T] = DataTree(
-        name=name,
-        valid=True,
-        node=ValidNode(contents=callback(name, root), subnodes=[]),
-    )
-    if isinstance(block.node, ValidNode):
-        if hasattr(root, "items"):
-            for k, v in root.items():  # type: ignore
-                if v is not None:
-                    block.node.subnodes.append(h5_tree_map(callback, v))
-                else:
-                    block.node.subnodes.append(
-                        DataTree(
-                            name=k,
-                            valid=False,
-                            node=InvalidNode(reason=InvalidNodeReason.MISSING_LINK),
-                        )
-                    )
-    return block
+    contents = callback(name, root)
+    subnodes: list[dict[str, Any]] = []
+    if hasattr(root, "items"):
+        for k, v in root.items():  # type: ignore
+            if v is not None:
+                subnodes.append(h5_tree_map(callback, v))
+            else:
+                subnodes.append(
+                    {
+                        "name": k,
+                        "valid": False,
+                        "node": {"reason": InvalidNodeReason.MISSING_LINK},
+                    }
+                )
+    return {
+        "name": name,
+        "valid": True,
+        "node": {"contents": contents, "subnodes": subnodes},
+    }
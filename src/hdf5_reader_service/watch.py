@@ -0,0 +1,201 @@
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .cache import invalidate, is_under, set_watched_roots
+from .model import FileChangeKind
+
+LOGGER = logging.getLogger(__name__)
+
+WATCH_ROOTS = [
+    root for root in os.getenv("HDF5_WATCH_ROOTS", "").split(os.pathsep) if root
+]
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+_CHANGE_KINDS = [
+    (IN_CLOSE_WRITE, FileChangeKind.CLOSED),
+    (IN_MODIFY, FileChangeKind.MODIFIED),
+    (IN_CREATE | IN_MOVED_TO, FileChangeKind.CREATED),
+    (IN_DELETE | IN_MOVED_FROM | IN_DELETE_SELF, FileChangeKind.DELETED),
+]
+
+
+class FileWatcher:
+    """
+    Watch directory trees with inotify (Linux only), calling on_change with the
+    path and kind of every change to a file or directory in them. Changes read
+    together are coalesced, so a burst of writes to one file is reported once.
+    """
+
+    def __init__(
+        self, roots: list[str], on_change: Callable[[str, FileChangeKind], None]
+    ):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.roots = roots
+        self.on_change = on_change
+        self._directories: dict[int, str] = {}
+        self._stop_read, self._stop_write = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name="file-watcher", daemon=True
+        )
+        for root in roots:
+            self._watch_tree(root)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        os.write(self._stop_write, b"\0")
+        self._thread.join()
+        for fd in (self._fd, self._stop_read, self._stop_write):
+            os.close(fd)
+
+    def _watch_tree(self, root: str) -> None:
+        for directory, _, _ in os.walk(root):
+            wd = self._add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                LOGGER.warning(
+                    "Cannot watch %s: %s", directory, os.strerror(ctypes.get_errno())
+                )
+            else:
+                self._directories[wd] = directory
+
+    def _run(self) -> None:
+        while True:
+            ready, _, _ = select.select([self._fd, self._stop_read], [], [])
+            if self._stop_read in ready:
+                return
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            changes: dict[str, FileChangeKind] = {}
+            for path, mask in self._parse(buffer):
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+                for flags, kind in _CHANGE_KINDS:
+                    if mask & flags:
+                        changes[path] = kind
+                        break
+            for path, kind in changes.items():
+                try:
+                    self.on_change(path, kind)
+                except Exception:
+                    LOGGER.exception("Failed to handle change to %s", path)
+
+    def _parse(self, buffer: bytes) -> list[tuple[str, int]]:
+        events = []
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost, so anything may have changed
+                events.extend((root, IN_MODIFY | IN_ISDIR) for root in self.roots)
+                continue
+            directory = self._directories.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._directories[wd]
+                continue
+            events.append((os.path.join(directory, name) if name else directory, mask))
+        return events
+
+
+class ChangeNotifier:
+    """
+    Fan out file changes, published from any thread, to subscribers on the event
+    loop. Slow subscribers miss changes rather than hold up everyone else.
+    """
+
+    def __init__(self, max_pending: int = 1000):
+        self.max_pending = max_pending
+        self._subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(self.max_pending)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def publish(self, change: dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            loop.call_soon_threadsafe(_put_if_room, queue, change)
+
+
+def _put_if_room(queue: asyncio.Queue, item: Any) -> None:
+    if not queue.full():
+        queue.put_nowait(item)
+
+
+NOTIFIER = ChangeNotifier()
+
+
+def handle_change(path: str, kind: FileChangeKind) -> None:
+    invalidate(path)
+    NOTIFIER.publish({"path": path, "kind": kind})
+
+
+def start_watcher() -> FileWatcher | None:
+    """Watch the configured roots, if any, invalidating caches on every change."""
+    if not WATCH_ROOTS:
+        return None
+    if not sys.platform.startswith("linux"):
+        LOGGER.warning("File watching needs inotify, not available on %s", sys.platform)
+        return None
+    watcher = FileWatcher(WATCH_ROOTS, handle_change)
+    set_watched_roots(WATCH_ROOTS)
+    watcher.start()
+    return watcher
+
+
+def is_relevant(change: dict[str, Any], path: str | None) -> bool:
+    return path is None or is_under(change["path"], path)
@@ -2,6 +2,8 @@ from os.path import abspath
 from pathlib import Path
 from posixpath import dirname
 
+import h5py
+import numpy as np
 import pytest
 
 _TEST_DIR_PATH = Path(dirname(abspath(__file__)))
@@ -11,3 +13,28 @@ _TEST_DATA_PATH = _TEST_DIR_PATH / "test-data/p45-104.nxs"
 @pytest.fixture(scope="session")
 def test_data_path() -> Path:
     return _TEST_DATA_PATH
+
+
+#: Contents of the synthetic test file, by dataset
+SYNTHETIC_DATA = {
+    "/contiguous": np.arange(20 * 30, dtype="<f8").reshape(20, 30),
+    "/big_endian": np.arange(12, dtype=">i4").reshape(3, 4),
+    "/compressed": (np.arange(8 * 64 * 64) % 251).astype("<u2").reshape(8, 64, 64),
+}
+
+
+@pytest.fixture(scope="session")
+def synthetic_data_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A file written by the tests, for storage layouts the test data lacks."""
+    path = tmp_path_factory.mktemp("synthetic") / "synthetic.h5"
+    with h5py.File(path, "w") as f:
+        f["/contiguous"] = SYNTHETIC_DATA["/contiguous"]
+        f["/big_endian"] = SYNTHETIC_DATA["/big_endian"]
+        f.create_dataset(
+            "/compressed",
+            data=SYNTHETIC_DATA["/compressed"],
+            chunks=(1, 32, 32),
+            compression="gzip",
+            shuffle=True,
+        )
+    return path
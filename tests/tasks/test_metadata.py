@@ -39,4 +39,4 @@ TEST_CASES = {
 @pytest.mark.parametrize("subpath,expected", TEST_CASES.items())
 def test_metadata(test_data_path: Path, subpath: str, expected: MetadataNode) -> None:
     metadata = fetch_metadata(str(test_data_path), subpath, True)
-    assert expected == metadata
+    assert expected == MetadataNode.model_validate(metadata)
@@ -1,9 +1,11 @@
+import re
 from pathlib import Path
 
 import pytest
 
-from hdf5_reader_service.model import NodeChildren
-from hdf5_reader_service.tasks import fetch_children
+from hdf5_reader_service.model import NodeChildren, NodeKind, SearchResults
+from hdf5_reader_service.tasks import fetch_children, fetch_flat_tree
+from hdf5_reader_service.tasks.search import search_index
 
 TEST_CASES = {
     "/": NodeChildren(nodes=["entry"]),
@@ -33,7 +35,7 @@ def test_fetch_children(
     test_data_path: Path, subpath: str, expected: NodeChildren
 ) -> None:
     children = fetch_children(str(test_data_path), subpath, True)
-    assert expected == children
+    assert expected == NodeChildren.model_validate(children)
 
 
 def test_fetch_children_of_dataset(test_data_path: Path) -> None:
@@ -44,3 +46,48 @@ def test_fetch_children_of_dataset(test_data_path: Path) -> None:
 def test_fetch_children_of_broken_link(test_data_path: Path) -> None:
     with pytest.raises(KeyError):
         fetch_children(str(test_data_path), "/entry/DIFFRACTION/simx", True)
+
+
+FIND_TEST_CASES = {
+    "pattern=count_time": (
+        {"pattern": "count_time"},
+        [
+            "/entry/instrument/DIFFRACTION/count_time",
+            "/entry/instrument/IZERO/count_time",
+        ],
+    ),
+    "pattern=/entry/*/IZERO": (
+        {"pattern": "/entry/*/IZERO"},
+        ["/entry/instrument/IZERO"],
+    ),
+    "regex=sum$": (
+        {"regex": "sum$", "kind": NodeKind.GROUP},
+        ["/entry/DIFFRACTION.sum", "/entry/IZERO.sum"],
+    ),
+    "attribute=NX_class=NXdetector": (
+        {"attribute": ["NX_class=NXdetector"]},
+        ["/entry/instrument/DIFFRACTION", "/entry/instrument/IZERO"],
+    ),
+    "attribute=axes=simx": (
+        {"attribute": ["axes=simx"], "subpath": "/entry/DIFFRACTION"},
+        ["/entry/DIFFRACTION"],
+    ),
+    "attribute=signal,subpath=/entry/instrument": (
+        {"attribute": ["signal"], "subpath": "/entry/instrument"},
+        [],
+    ),
+}
+
+
+@pytest.mark.parametrize("criteria,expected", FIND_TEST_CASES.values())
+def test_search_index(
+    test_data_path: Path, criteria: dict, expected: list[str]
+) -> None:
+    index = fetch_flat_tree(str(test_data_path), "/", True)
+    criteria = dict(criteria)
+    if "regex" in criteria:
+        criteria["regex"] = re.compile(criteria["regex"])
+    if "attribute" in criteria:
+        criteria["attributes"] = criteria.pop("attribute")
+    results = SearchResults.model_validate(search_index(index, **criteria))
+    assert [match.path for match in results.matches] == expected
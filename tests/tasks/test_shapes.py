@@ -155,4 +155,4 @@ def test_fetch_shapes(
     test_data_path: Path, subpath: str, expected: DataTree[ShapeMetadata]
 ) -> None:
     shapes = fetch_shapes(str(test_data_path), subpath, True)
-    assert expected == shapes
+    assert expected == DataTree[ShapeMetadata].model_validate(shapes)
@@ -9,12 +9,14 @@ from hdf5_reader_service.model import (
     DatasetMicroStructure,
     DatasetStructure,
     DataTree,
+    FlatTree,
     InvalidNode,
     InvalidNodeReason,
     MetadataNode,
+    NodeKind,
     ValidNode,
 )
-from hdf5_reader_service.tasks import fetch_tree
+from hdf5_reader_service.tasks import fetch_flat_tree, fetch_tree
 
 TEST_CASES: Mapping[str, DataTree[MetadataNode]] = {
     "/entry/sample/name": DataTree(
@@ -346,4 +348,46 @@ def test_fetch_tree(
     test_data_path: Path, subpath: str, expected: DataTree[MetadataNode]
 ) -> None:
     tree = fetch_tree(str(test_data_path), subpath, True)
-    assert expected == tree
+    assert expected == DataTree[MetadataNode].model_validate(tree)
+
+
+FLAT_TEST_CASES: Mapping[str, FlatTree] = {
+    "/entry/sample": FlatTree(
+        paths=["/entry/sample", "/entry/sample/description", "/entry/sample/name"],
+        parents=[-1, 0, 0],
+        kinds=[NodeKind.GROUP, NodeKind.DATASET, NodeKind.DATASET],
+        shapes=[None, (), ()],
+        dtypes=[None, "|O", "|O"],
+        chunks=[None, None, None],
+        attribute_offsets=[0, 1, 1, 1],
+        attribute_names=["NX_class"],
+        attribute_values=["NXsample"],
+    ),
+    "/entry/instrument/IZERO": FlatTree(
+        paths=[
+            "/entry/instrument/IZERO",
+            "/entry/instrument/IZERO/count_time",
+            "/entry/instrument/IZERO/data",
+            "/entry/instrument/IZERO/sum",
+        ],
+        parents=[-1, 0, 0, 0],
+        kinds=[
+            NodeKind.GROUP,
+            NodeKind.DATASET,
+            NodeKind.MISSING_LINK,
+            NodeKind.MISSING_LINK,
+        ],
+        shapes=[None, (), None, None],
+        dtypes=[None, "<f8", None, None],
+        chunks=[None, None, None, None],
+        attribute_offsets=[0, 1, 1, 1, 1],
+        attribute_names=["NX_class"],
+        attribute_values=["NXdetector"],
+    ),
+}
+
+
+@pytest.mark.parametrize("subpath,expected", FLAT_TEST_CASES.items())
+def test_fetch_flat_tree(test_data_path: Path, subpath: str, expected: FlatTree):
+    flat = fetch_flat_tree(str(test_data_path), subpath, True)
+    assert expected == FlatTree.model_validate(flat)
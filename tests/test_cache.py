@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from hdf5_reader_service.cache import LRUCache, file_identity
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 0)
+
+
+def test_lru_cache_is_bounded_by_size_of_values() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len)
+    cache.put("a", b"12345")
+    cache.put("b", b"1234")
+    cache.put("c", b"123")
+    assert "a" not in cache
+    assert cache.size == 7
+    cache.put("d", b"12345678901")
+    assert "d" not in cache
+    assert cache.get("d") is None
+    assert cache.misses == 1
+
+
+def test_lru_cache_discard() -> None:
+    cache: LRUCache[tuple[str, int], int] = LRUCache(10)
+    for i in range(4):
+        cache.put(("even" if i % 2 == 0 else "odd", i), i)
+    cache.discard(lambda key: key[0] == "odd")
+    assert len(cache) == 2
+    assert cache.size == 2
+
+
+def test_file_identity_changes_with_contents(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(b"1")
+    before = file_identity(str(path))
+    assert before == file_identity(str(path))
+    path.write_bytes(b"12")
+    assert before != file_identity(str(path))
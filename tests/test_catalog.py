@@ -0,0 +1,88 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from hdf5_reader_service.catalog import Catalog
+from hdf5_reader_service.model import CatalogFiles, CatalogNodes
+
+
+@pytest.fixture
+def root(tmp_path: Path, test_data_path: Path) -> Path:
+    root = tmp_path / "visit"
+    (root / "scans").mkdir(parents=True)
+    shutil.copy(test_data_path, root / "scans" / "p45-104.nxs")
+    (root / "broken.h5").write_bytes(b"not an HDF5 file")
+    (root / "notes.txt").write_text("ignored")
+    return root
+
+
+@pytest.fixture
+def catalog(tmp_path: Path, root: Path) -> Catalog:
+    catalog = Catalog(str(tmp_path / "catalog.sqlite"))
+    catalog.scan(str(root))
+    return catalog
+
+
+def test_files(catalog: Catalog, root: Path) -> None:
+    files = CatalogFiles.model_validate(catalog.files()).files
+    assert [f.path for f in files] == [
+        str(root / "broken.h5"),
+        str(root / "scans" / "p45-104.nxs"),
+    ]
+    assert files[0].error is not None
+    assert files[1].error is None
+
+
+def test_files_by_pattern(catalog: Catalog, root: Path) -> None:
+    files = CatalogFiles.model_validate(catalog.files(pattern="*.nxs")).files
+    assert [f.path for f in files] == [str(root / "scans" / "p45-104.nxs")]
+
+
+@pytest.mark.parametrize(
+    "criteria,expected",
+    [
+        (
+            {"pattern": "count_time"},
+            [
+                "/entry/instrument/DIFFRACTION/count_time",
+                "/entry/instrument/IZERO/count_time",
+            ],
+        ),
+        (
+            {"attributes": ["NX_class=NXdetector"]},
+            ["/entry/instrument/DIFFRACTION", "/entry/instrument/IZERO"],
+        ),
+        (
+            {"attributes": ["axes=simy", "signal=data"]},
+            ["/entry/DIFFRACTION", "/entry/IZERO"],
+        ),
+        (
+            {"pattern": "/entry/sample/*", "dtype": "|O"},
+            ["/entry/sample/description", "/entry/sample/name"],
+        ),
+        (
+            {"pattern": "count_time", "limit": 1},
+            ["/entry/instrument/DIFFRACTION/count_time"],
+        ),
+        ({"file_pattern": "*/broken.h5"}, []),
+    ],
+)
+def test_nodes(catalog: Catalog, criteria: dict, expected: list[str]) -> None:
+    nodes = CatalogNodes.model_validate(catalog.nodes(**criteria)).nodes
+    assert [node.path for node in nodes] == expected
+
+
+def test_scan_is_incremental(catalog: Catalog, root: Path) -> None:
+    assert catalog.scan(str(root)) == 0
+
+    nexus_file = root / "scans" / "p45-104.nxs"
+    os.utime(nexus_file, ns=(0, 0))
+    assert catalog.scan(str(root)) == 1
+
+    nexus_file.unlink()
+    assert catalog.scan(str(root)) == 0
+    files = CatalogFiles.model_validate(catalog.files()).files
+    assert [f.path for f in files] == [str(root / "broken.h5")]
+    assert CatalogNodes.model_validate(catalog.nodes()).nodes == []
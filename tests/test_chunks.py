@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from hdf5_reader_service import chunks
+from hdf5_reader_service.chunks import _axis_chunks, read_chunks, read_in_parallel
+from hdf5_reader_service.tasks.slice import read_slice
+
+SELECTIONS = [
+    (slice(None), slice(None), slice(None)),
+    (slice(0, 1), slice(2, 11), slice(3, 17)),
+    (slice(1, 10, 3), slice(0, 13, 4), slice(5, 6)),
+    (slice(2, 9), slice(1, 12, 7), slice(0, 17, 2)),
+    (slice(4, 4), slice(None), slice(None)),
+    (slice(0, 100), slice(5, 7)),
+]
+
+
+@pytest.fixture
+def dataset(tmp_path: Path):
+    data = np.arange(10 * 13 * 17, dtype="<f4").reshape(10, 13, 17)
+    with h5py.File(tmp_path / "compressed.h5", "w") as f:
+        d = f.create_dataset(
+            "data",
+            shape=data.shape,
+            dtype=data.dtype,
+            chunks=(4, 5, 6),
+            compression="gzip",
+            shuffle=True,
+            fillvalue=-1,
+        )
+        # Leave the last chunks along the first axis unwritten
+        d[:8] = data[:8]
+    with h5py.File(tmp_path / "compressed.h5", "r") as f:
+        yield f["data"]
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_read_chunks_matches_hdf5(dataset: h5py.Dataset, selection) -> None:
+    padded = selection + (slice(None),) * (dataset.ndim - len(selection))
+    ranges = tuple(s.indices(n) for s, n in zip(padded, dataset.shape, strict=True))
+    np.testing.assert_array_equal(read_chunks(dataset, ranges), dataset[selection])
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_read_slice_matches_hdf5(dataset: h5py.Dataset, selection) -> None:
+    np.testing.assert_array_equal(read_slice(dataset, selection), dataset[selection])
+
+
+def test_read_in_parallel(dataset: h5py.Dataset, monkeypatch) -> None:
+    monkeypatch.setattr(chunks, "DECOMPRESSION_THREADS", 4)
+    assert read_in_parallel(dataset, ((0, 10, 1), (0, 13, 1), (0, 17, 1)))
+    assert not read_in_parallel(dataset, ((0, 1, 1), (0, 1, 1), (0, 1, 1)))
+    monkeypatch.setattr(chunks, "DECOMPRESSION_THREADS", 1)
+    assert not read_in_parallel(dataset, ((0, 10, 1), (0, 13, 1), (0, 17, 1)))
+
+
+def test_unsupported_filters_are_not_read_in_parallel(tmp_path: Path) -> None:
+    with h5py.File(tmp_path / "fletcher.h5", "w") as f:
+        d = f.create_dataset(
+            "data", shape=(100,), dtype="f4", chunks=(10,), fletcher32=True
+        )
+        assert not read_in_parallel(d, ((0, 100, 1),))
+
+
+@pytest.mark.parametrize(
+    "axis,expected",
+    [
+        ((0, 10, 1, 4), [(0, 0, 4), (4, 0, 4), (8, 0, 2)]),
+        ((3, 9, 1, 4), [(0, 3, 4), (4, 0, 4), (8, 0, 1)]),
+        ((1, 17, 10, 4), [(0, 1, 4), (8, 3, 4)]),
+        ((0, 0, 1, 4), []),
+    ],
+)
+def test_axis_chunks(axis, expected) -> None:
+    start, stop, step, chunk = axis
+    parts = _axis_chunks(start, stop, step, chunk)
+    assert [(origin, s.start, s.stop) for origin, s, _ in parts] == expected
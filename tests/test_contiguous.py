@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from hdf5_reader_service.contiguous import map_dataset
+from hdf5_reader_service.tasks.slice import read_slice
+
+
+@pytest.mark.parametrize("subpath", ["/contiguous", "/big_endian"])
+@pytest.mark.parametrize(
+    "selection", [(slice(None),), (slice(1, 3), slice(0, 4, 2)), (slice(2, 3),)]
+)
+def test_mapped_slices_match_hdf5(
+    synthetic_data_path: Path, subpath: str, selection
+) -> None:
+    with h5py.File(synthetic_data_path, "r") as f:
+        dataset = f[subpath]
+        mapped = map_dataset(dataset)
+        assert mapped is not None
+        np.testing.assert_array_equal(mapped[selection], dataset[selection])
+        data = read_slice(dataset, selection)
+        assert data.dtype == dataset.dtype
+        assert data.flags.c_contiguous
+        np.testing.assert_array_equal(data, dataset[selection])
+
+
+def test_map_dataset_with_userblock(tmp_path: Path) -> None:
+    path = tmp_path / "userblock.h5"
+    with h5py.File(path, "w", userblock_size=512) as f:
+        f["data"] = np.arange(10)
+    with h5py.File(path, "r") as f:
+        mapped = map_dataset(f["data"])
+        assert mapped is not None
+        np.testing.assert_array_equal(mapped, np.arange(10))
+
+
+def test_only_contiguous_data_is_mapped(tmp_path: Path) -> None:
+    with h5py.File(tmp_path / "layouts.h5", "w") as f:
+        chunked = f.create_dataset("chunked", data=np.arange(10), chunks=(5,))
+        plist = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+        plist.set_layout(h5py.h5d.COMPACT)
+        compact = f.create_dataset("compact", data=np.arange(10), dcpl=plist)
+        unwritten = f.create_dataset("unwritten", shape=(10,), dtype="f4")
+        strings = f.create_dataset("strings", data=["a", "bc"])
+        scalar = f.create_dataset("scalar", data=1.0)
+        for dataset in (chunked, compact, unwritten, strings, scalar):
+            assert map_dataset(dataset) is None, dataset.name
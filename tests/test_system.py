@@ -7,14 +7,20 @@ from fastapi.testclient import TestClient
 from hdf5_reader_service.app import app
 from hdf5_reader_service.model import (
     DataTree,
+    FlatTree,
     MetadataNode,
     NodeChildren,
+    NodeKind,
+    SearchResults,
     ShapeMetadata,
 )
+from tests.conftest import SYNTHETIC_DATA
 from tests.tasks.test_metadata import TEST_CASES as METADATA_TEST_CASES
+from tests.tasks.test_search import FIND_TEST_CASES
 from tests.tasks.test_search import TEST_CASES as SEARCH_TEST_CASES
 from tests.tasks.test_shapes import TEST_CASES as SHAPE_TEST_CASES
 from tests.tasks.test_slice import TEST_CASES as SLICE_TEST_CASES
+from tests.tasks.test_tree import FLAT_TEST_CASES as FLAT_TREE_TEST_CASES
 from tests.tasks.test_tree import TEST_CASES as TREE_TEST_CASES
 
 
@@ -60,6 +66,41 @@ def test_read_tree(
     assert actual_tree == tree
 
 
+@pytest.mark.parametrize("subpath,tree", FLAT_TREE_TEST_CASES.items())
+def test_read_columnar_tree(
+    client: TestClient, test_data_path: Path, subpath: str, tree: FlatTree
+):
+    response = client.get(
+        "/tree/",
+        params={"path": str(test_data_path), "subpath": subpath, "format": "columnar"},
+    )
+    assert response.status_code == 200
+    assert FlatTree.model_validate(response.json()) == tree
+
+
+@pytest.mark.parametrize("subpath,tree", FLAT_TREE_TEST_CASES.items())
+def test_read_arrow_tree(
+    client: TestClient, test_data_path: Path, subpath: str, tree: FlatTree
+):
+    pa = pytest.importorskip("pyarrow")
+    response = client.get(
+        "/tree/",
+        params={"path": str(test_data_path), "subpath": subpath, "format": "arrow"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("path").to_pylist() == tree.paths
+    assert table.column("parent").to_pylist() == tree.parents
+    assert table.column("kind").to_pylist() == [k.value for k in tree.kinds]
+    assert table.column("attribute_names").to_pylist() == [
+        tree.attribute_names[start:stop]
+        for start, stop in zip(
+            tree.attribute_offsets[:-1], tree.attribute_offsets[1:], strict=True
+        )
+    ]
+
+
 @pytest.mark.parametrize("subpath,metadata", METADATA_TEST_CASES.items())
 def test_read_info(
     client: TestClient, test_data_path: Path, subpath: str, metadata: MetadataNode
@@ -84,6 +125,25 @@ def test_read_search(
     assert actual_children == children
 
 
+@pytest.mark.parametrize("criteria,expected", FIND_TEST_CASES.values())
+def test_find(
+    client: TestClient, test_data_path: Path, criteria: dict, expected: list[str]
+):
+    params = {
+        key: value.value if isinstance(value, NodeKind) else value
+        for key, value in criteria.items()
+    }
+    response = client.get("/find/", params={"path": str(test_data_path), **params})
+    assert response.status_code == 200
+    results = SearchResults.model_validate(response.json())
+    assert [match.path for match in results.matches] == expected
+
+
+def test_find_with_invalid_regex(client: TestClient, test_data_path: Path):
+    response = client.get("/find/", params={"path": str(test_data_path), "regex": "("})
+    assert response.status_code == 400
+
+
 @pytest.mark.parametrize("slice_info,expected_array", SLICE_TEST_CASES.items())
 def test_read_slice(
     client: TestClient,
@@ -102,3 +162,46 @@ def test_read_slice(
     assert response.status_code == 200
     data_slice = np.array(response.json())
     np.testing.assert_array_equal(data_slice, expected_array)
+
+
+def test_catalog_not_configured(client: TestClient):
+    response = client.get("/catalog/files/")
+    assert response.status_code == 404
+
+
+def test_changes_not_configured(client: TestClient):
+    response = client.get("/changes/")
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "subpath,slice_info,selection",
+    [
+        ("/contiguous", "2:5:1,0:30:3", np.s_[2:5, 0:30:3]),
+        ("/big_endian", "0:3:1,1:3:1", np.s_[0:3, 1:3]),
+        ("/compressed", "0:8:1,0:64:1,0:64:1", np.s_[0:8, 0:64, 0:64]),
+    ],
+)
+def test_read_binary_slice(
+    client: TestClient,
+    synthetic_data_path: Path,
+    subpath: str,
+    slice_info: str,
+    selection: tuple,
+):
+    response = client.get(
+        "/slice/",
+        params={
+            "path": str(synthetic_data_path),
+            "subpath": subpath,
+            "slice_info": slice_info,
+            "format": "binary",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+    shape = tuple(int(n) for n in response.headers["x-array-shape"].split(","))
+    data_slice = np.frombuffer(
+        response.content, dtype=np.dtype(response.headers["x-array-dtype"])
+    ).reshape(shape)
+    np.testing.assert_array_equal(data_slice, SYNTHETIC_DATA[subpath][selection])
@@ -174,4 +174,32 @@ def test_h5_visit_map(
     from pprint import pprint
 
     pprint(tree)
-    assert expected_tree == tree
+    assert expected_tree == DataTree.model_validate(tree)
+
+
+def test_h5_tree_map_is_natively_serializable(test_data_path: Path) -> None:
+    import orjson
+
+    with h5.File(test_data_path) as f:
+        tree = h5_tree_map(lambda name, obj: {"name": name}, f["/entry/sample"])
+
+    # No default hook: the tree must be made of types orjson understands
+    assert orjson.loads(orjson.dumps(tree)) == {
+        "name": "sample",
+        "valid": True,
+        "node": {
+            "contents": {"name": "sample"},
+            "subnodes": [
+                {
+                    "name": "description",
+                    "valid": True,
+                    "node": {"contents": {"name": "description"}, "subnodes": []},
+                },
+                {
+                    "name": "name",
+                    "valid": True,
+                    "node": {"contents": {"name": "name"}, "subnodes": []},
+                },
+            ],
+        },
+    }
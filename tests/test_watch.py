@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from hdf5_reader_service import cache
+from hdf5_reader_service.cache import file_identity, invalidate, set_watched_roots
+from hdf5_reader_service.model import FileChangeKind
+from hdf5_reader_service.watch import ChangeNotifier, FileWatcher
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+
+
+class Changes:
+    def __init__(self):
+        self.seen: list[tuple[str, FileChangeKind]] = []
+        self.condition = threading.Condition()
+
+    def __call__(self, path: str, kind: FileChangeKind) -> None:
+        with self.condition:
+            self.seen.append((path, kind))
+            self.condition.notify_all()
+
+    def wait_for(self, path: Path, kind: FileChangeKind) -> None:
+        with self.condition:
+            assert self.condition.wait_for(
+                lambda: (str(path), kind) in self.seen, timeout=5
+            ), self.seen
+
+
+@pytest.fixture
+def changes(tmp_path: Path):
+    changes = Changes()
+    watcher = FileWatcher([str(tmp_path)], changes)
+    watcher.start()
+    yield changes
+    watcher.stop()
+
+
+def test_watcher_reports_writes(tmp_path: Path, changes: Changes) -> None:
+    path = tmp_path / "scan.h5"
+    path.write_bytes(b"data")
+    changes.wait_for(path, FileChangeKind.CLOSED)
+    path.unlink()
+    changes.wait_for(path, FileChangeKind.DELETED)
+
+
+def test_watcher_follows_new_directories(tmp_path: Path, changes: Changes) -> None:
+    directory = tmp_path / "new"
+    directory.mkdir()
+    changes.wait_for(directory, FileChangeKind.CREATED)
+    path = directory / "scan.h5"
+    path.write_bytes(b"data")
+    changes.wait_for(path, FileChangeKind.CLOSED)
+
+
+def test_watched_identities_are_trusted_until_invalidated(tmp_path: Path) -> None:
+    path = tmp_path / "scan.h5"
+    path.write_bytes(b"data")
+    set_watched_roots([str(tmp_path)])
+    try:
+        before = file_identity(str(path))
+        path.write_bytes(b"more data")
+        assert file_identity(str(path)) == before
+        invalidate(str(tmp_path))
+        assert file_identity(str(path)) != before
+    finally:
+        set_watched_roots([])
+    assert cache._known_identities == {}
+
+
+def test_notifier_fans_out_to_subscribers() -> None:
+    notifier = ChangeNotifier(max_pending=1)
+
+    async def receive() -> list:
+        first, second = notifier.subscribe(), notifier.subscribe()
+        thread = threading.Thread(target=notifier.publish, args=({"path": "/a"},))
+        thread.start()
+        thread.join()
+        # Over max_pending, dropped
+        notifier.publish({"path": "/b"})
+        received = [await first.get(), await second.get()]
+        notifier.unsubscribe(first)
+        notifier.unsubscribe(second)
+        await asyncio.sleep(0)
+        assert first.empty() and second.empty()
+        return received
+
+    assert asyncio.run(receive()) == [{"path": "/a"}, {"path": "/a"}]